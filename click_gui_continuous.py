@@ -1,45 +1,94 @@
-import pyautogui
 import time
 import subprocess
 
 import socket
 import os
+import sys
+import json
+import ctypes
+from ctypes import wintypes
+from concurrent.futures import ThreadPoolExecutor
 
 # import sys
 # sys.path.append('..')
 # import optitrack_streaming
 
+INPUT_MOUSE = 0
+MOUSEEVENTF_LEFTDOWN = 0x0002
+MOUSEEVENTF_LEFTUP = 0x0004
+
+class MOUSEINPUT(ctypes.Structure):
+    _fields_ = [("dx", wintypes.LONG), ("dy", wintypes.LONG), ("mouseData", wintypes.DWORD),
+                ("dwFlags", wintypes.DWORD), ("time", wintypes.DWORD), ("dwExtraInfo", ctypes.c_size_t)]
+
+class INPUT(ctypes.Structure):
+    _fields_ = [("type", wintypes.DWORD), ("mi", MOUSEINPUT)]
+
+# Left button down + up, built once and reused for every click
+CLICK_INPUTS = (INPUT * 2)(
+    INPUT(INPUT_MOUSE, MOUSEINPUT(0, 0, 0, MOUSEEVENTF_LEFTDOWN, 0, 0)),
+    INPUT(INPUT_MOUSE, MOUSEINPUT(0, 0, 0, MOUSEEVENTF_LEFTUP, 0, 0)),
+)
+
+if sys.platform == 'win32':
+    user32 = ctypes.windll.user32
+    # Use physical pixel coordinates, as pyautogui did
+    user32.SetProcessDPIAware()
+
+def click(x, y):
+    # Native replacement for pyautogui.click without its per-call lookups and pauses
+    user32.SetCursorPos(x, y)
+    user32.SendInput(len(CLICK_INPUTS), CLICK_INPUTS, ctypes.sizeof(INPUT))
+
 def update_cfg_timestamp():
-    # Code based on: https://stackoverflow.com/questions/4719438/editing-specific-line-in-text-file-in-python
     timestamp = int(time.time()*100)
-    with open('cf.json', 'r') as f:
-        data = f.readlines()
-
-    data[22] = f'      "filePrefix": "adc_data_{timestamp}",\n'
-    with open('cf.json', 'w') as f:
-        f.writelines( data )
+    # Edit the parsed config in place rather than a hardcoded line of the file
+    with open('cf.json', 'r+') as f:
+        cfg = json.load(f)
+        cfg['DCA1000Config']['captureConfig']['filePrefix'] = f'adc_data_{timestamp}'
+        f.seek(0)
+        json.dump(cfg, f, indent=2)
+        f.truncate()
     return timestamp
 
-def run_powershell(cmd):
-    completed = subprocess.run(["powershell", "-Command", cmd], capture_output=True, cwd="C:\\ti\\mmwave_studio_02_01_01_00\\mmWaveStudio\\PostProc")
-    return completed
-
-def run_powershell_nonblocking(cmd):
-    completed = subprocess.Popen(["powershell", "-Command", cmd], cwd="C:\\ti\\mmwave_studio_02_01_01_00\\mmWaveStudio\\PostProc")
-    return completed
+PS_SENTINEL = b'___DONE___'
+
+def start_powershell():
+    # One long-lived shell so each command doesn't pay powershell.exe's startup cost
+    return subprocess.Popen(["powershell", "-NoLogo", "-NoProfile", "-NoExit", "-Command", "-"],
+                            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                            cwd="C:\\ti\\mmwave_studio_02_01_01_00\\mmWaveStudio\\PostProc")
+
+def ps_exec(ps, cmd):
+    # Run cmd in the persistent shell and read its output up to the sentinel line
+    ps.stdin.write(f'{cmd}\n[Console]::Out.WriteLine("{PS_SENTINEL.decode()} $LASTEXITCODE")\n'.encode())
+    ps.stdin.flush()
+    output = []
+    while True:
+        line = ps.stdout.readline()
+        if not line:
+            raise RuntimeError('PowerShell session exited')
+        if line.startswith(PS_SENTINEL):
+            break
+        output.append(line)
+    code = line[len(PS_SENTINEL):].strip()
+    returncode = int(code) if code.lstrip(b'-').isdigit() else 0
+    return subprocess.CompletedProcess(cmd, returncode, stdout=b''.join(output))
 
 def get_latest_binary(folder):
-    filenames = sorted(os.listdir(folder))
-    # print(filenames)
-    for k, filename in enumerate(filenames[::-1]):
-        if filename[-4:] != '.bin': continue
-        return int(filename[8:18])
+    # Only the newest .bin is needed, so take the max name instead of sorting everything
+    with os.scandir(folder) as entries:
+        filenames = [e.name for e in entries if e.name.endswith('.bin')]
+    if not filenames: return None
+    return int(max(filenames)[8:18])
 
 def get_created_modified_date(folder, timestamp):
     filename = f'{folder}\\adc_data_{timestamp}_Raw_0.bin'
-    print(os.path.getmtime(filename))
-    print(os.path.getctime(filename))
-    return os.path.getctime(filename), os.path.getmtime(filename)
+    # One stat call gives both times
+    st = os.stat(filename)
+    print(st.st_mtime)
+    print(st.st_ctime)
+    return st.st_ctime, st.st_mtime
 
 if __name__=='__main__':
     data_folder = 'C:\\ti\\mmwave_studio_02_01_01_00\\mmWaveStudio\\PostProc\\Data'
@@ -49,11 +98,15 @@ if __name__=='__main__':
 
     cwd = os.getcwd()
     print(cwd)
+    ps = start_powershell()
+    # Background worker so stop_record can finish while start_record spins up; the main
+    # thread doesn't touch the session until it has waited on the result
+    ps_pool = ThreadPoolExecutor(max_workers=1)
     
-    resp = run_powershell(f"C:\\ti\\mmwave_studio_02_01_01_00\\mmWaveStudio\\PostProc\\DCA1000EVM_CLI_Control.exe fpga {cwd}\\cf.json")
+    resp = ps_exec(ps, f"C:\\ti\\mmwave_studio_02_01_01_00\\mmWaveStudio\\PostProc\\DCA1000EVM_CLI_Control.exe fpga {cwd}\\cf.json")
     # print(resp.returncode)
     print(resp.stdout.decode("utf-8"))
-    resp = run_powershell(f"C:\\ti\\mmwave_studio_02_01_01_00\\mmWaveStudio\\PostProc\\DCA1000EVM_CLI_Control.exe record {cwd}\\cf.json")
+    resp = ps_exec(ps, f"C:\\ti\\mmwave_studio_02_01_01_00\\mmWaveStudio\\PostProc\\DCA1000EVM_CLI_Control.exe record {cwd}\\cf.json")
     print(resp.returncode)
     print(resp.stdout.decode("utf-8"))
 
@@ -102,15 +155,20 @@ if __name__=='__main__':
             print(f'Taking measurement {i}')
             i += 1
             timestamp = update_cfg_timestamp()
-            resp = run_powershell(f"C:\\ti\\mmwave_studio_02_01_01_00\\mmWaveStudio\\PostProc\\DCA1000EVM_CLI_Control.exe stop_record {cwd}\\cf.json")
-            # print("1: ", resp)
-            resp = run_powershell_nonblocking(f"C:\\ti\\mmwave_studio_02_01_01_00\\mmWaveStudio\\PostProc\\DCA1000EVM_CLI_Record.exe start_record {cwd}\\cf.json")
+            stop_resp = ps_pool.submit(ps_exec, ps, f"C:\\ti\\mmwave_studio_02_01_01_00\\mmWaveStudio\\PostProc\\DCA1000EVM_CLI_Control.exe stop_record {cwd}\\cf.json")
+            # Launched directly rather than through the shell so the recorder keeps writing to
+            # this console instead of the session's pipe, which nothing reads while it records
+            recorder = subprocess.Popen(["C:\\ti\\mmwave_studio_02_01_01_00\\mmWaveStudio\\PostProc\\DCA1000EVM_CLI_Record.exe", "start_record", f"{cwd}\\cf.json"],
+                                        cwd="C:\\ti\\mmwave_studio_02_01_01_00\\mmWaveStudio\\PostProc")
             # print("2: ", resp)
             time.sleep(0.5/2)
+            # Make sure the previous recording has stopped before triggering the next frame
+            resp = stop_resp.result()
+            # print("1: ", resp)
 
-            pyautogui.click(22, 995) # Original, Working after adding optitrack
-            # pyautogui.click(30, 940) # New resolution after member event
-            # pyautogui.click(30, 700) # New resolution after member event
+            click(22, 995) # Original, Working after adding optitrack
+            # click(30, 940) # New resolution after member event
+            # click(30, 700) # New resolution after member event
 
             # time.sleep(70/8*2+3) # CIRCLE TODO: This sleep needs to be long enough for radar to finish, depends on radar settings
             #time.sleep(70/8+3) # TODO: This sleep needs to be long enough for radar to finish, depends on radar settings
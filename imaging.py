@@ -1,5 +1,7 @@
 import argparse
 from src.iwr1443.radar import Radar
+from src.iwr1443.dsp import background_subtraction
+from src.iwr1443 import log_queue
 import numpy as np
 from PyQt6 import QtWidgets
 from src.distance_plot import DistancePlot
@@ -28,14 +30,6 @@ def sliding_window_average(frame, window_size):
     return filtered[pad:-pad]
 
 
-def background_subtraction(frame):
-    after_subtraction = np.zeros_like(frame)
-    for i in range(1, frame.shape[0]):
-        after_subtraction[i - 1] = frame[i] - frame[i - 1]
-
-    return after_subtraction
-
-
 def main():
     parser = argparse.ArgumentParser()
     parser.add_argument("--cfg", type=str, required=True, help="Path to radar config file")
@@ -81,7 +75,7 @@ def main():
     # dist_plot.resize(600, 600)
     # dist_plot.show()
     def generic_cb(msg):
-        print(f"got frame at time {msg["timestamp"]}")
+        log_queue.log(f"got frame at time {msg["timestamp"]}")
     # def update_frame(msg):
     #     frame = msg.get("data", None)
     #     if frame is None:
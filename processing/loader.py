@@ -4,15 +4,23 @@ It manages the proper folder structure for data in the dataset
 """
 
 import os
+import re
 import pickle
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 from PIL import Image
 from utils import *
-import json
+from src.iwr1443.dsp import lane_deinterleave
 
 from utils import *
 
 
+# Timestamp in exp_NUMBER_YYYY-MM-DD_HH-MM-SS.bin or exp_NUMBER_x-y-z_YYYY-MM-DD_HH_MM_SS.bin (year >= 2000)
+_TS_RE = re.compile(r'_([2-9]\d{3}[-_]\d{2}[-_]\d{2}[-_]\d{2}[-_]\d{2}[-_]\d{2})\.bin$')
+
+# Number of .bin files loaded concurrently by load_radar_files
+LOAD_WORKERS = 8
+
 
 class GenericLoader:
 
@@ -45,8 +53,7 @@ class GenericLoader:
             radar parameters (dictionary)
         """
         
-        f = open(f'{get_root_path()}/src/utilities/params.json')
-        params = json.load(f)
+        params = load_param_json()
         current = params['simulation' if is_sim else 'robot_collected'][radar_type]
         if not is_sim:
             current = current[aperture_type]
@@ -100,45 +107,50 @@ class GenericLoader:
         x_angle, y_angle, z_angle = self._find_obj_angles()
         path = self._get_path(radar_type, x_angle, y_angle, z_angle, is_processed=False) + "/radar_data"
         all_data = {}
-        filenames = sorted(os.listdir(path))
+        with os.scandir(path) as entries:
+            filenames = sorted(e.name for e in entries if e.name.endswith('.bin'))
         params_dict = self.get_radar_parameters(radar_type=radar_type, is_sim=False, aperture_type=aperture_type)
         NUM_FRAMES = params_dict['num_frames']
         SAMPLES_PER_CHIRP = params_dict['num_samples']
         NUM_CHIRP = params_dict['num_chirps']
+        timestamps = []
+        filepaths = []
         for i, filename in enumerate(filenames):
-            if filename[-4:] != '.bin': continue
-            
             # Parse filename: exp_NUMBER_YYYY-MM-DD_HH-MM-SS.bin or exp_NUMBER_x-y-z_YYYY-MM-DD_HH_MM_SS.bin
-            try:
-                # Remove .bin extension
-                name_without_ext = filename[:-4]
-                parts = name_without_ext.split('_')
-                
-                # Find the timestamp part (starts with year YYYY)
-                timestamp_str = None
-                for idx, part in enumerate(parts):
-                    if len(part) >= 4 and part[:4].isdigit() and int(part[:4]) >= 2000:
-                        # Found the start of timestamp, combine remaining parts
-                        timestamp_parts = parts[idx:]
-                        timestamp_str = '_'.join(timestamp_parts)
-                        break
-                
-                if timestamp_str is None:
-                    print(f'Could not parse timestamp from filename: {filename}')
-                    continue
-                
-                # Use the timestamp string as the key (can convert to datetime if needed later)
-                timestamp = timestamp_str.replace('-', '').replace('_', '')  # Convert to compact format
-                
-            except Exception as e:
-                print(f'Error parsing filename {filename}: {e}')
+            match = _TS_RE.search(filename)
+            if match is None:
+                print(f'Could not parse timestamp from filename: {filename}')
                 continue
 
-            fid = open(f'{path}/{filename}', 'rb')
-            adcData = np.fromfile(fid, dtype='<i2')
-            numLanes = 4
-            adcData = np.reshape(adcData, (int(adcData.shape[0] / (numLanes * 2)), numLanes * 2))
-            adcData = adcData[:, [0, 1, 2, 3]] + 1j * adcData[:, [4, 5, 6, 7]]
-            all_data[timestamp] = adcData
+            # Use the timestamp string as the key (can convert to datetime if needed later)
+            timestamps.append(match.group(1).replace('-', '').replace('_', ''))  # Convert to compact format
+            filepaths.append(f'{path}/{filename}')
+
+        # Files are independent and loading is I/O bound, so read several at once
+        with ThreadPoolExecutor(max_workers=LOAD_WORKERS) as executor:
+            for timestamp, adcData in zip(timestamps, executor.map(self._load_adc_file, filepaths)):
+                all_data[timestamp] = adcData
+
+        return all_data
+
+    @staticmethod
+    def _load_adc_file(filepath):
+        """
+        Load a single raw .bin file into complex ADC samples
+
+        Parameters:
+            filepath (str): path to the .bin file
 
-        return all_data
\ No newline at end of file
+        Returns:
+            complex64 array of shape (num_samples, 4), one column per receive lane
+        """
+        numLanes = 4
+        # np.memmap can't map an empty file (e.g. a failed measurement), so return no samples
+        if os.path.getsize(filepath) == 0:
+            return np.empty((0, numLanes), dtype=np.complex64)
+        # Map the file instead of reading it so only the rows we touch are paged in
+        raw = np.memmap(filepath, dtype='<i2', mode='r').reshape(-1, numLanes * 2)
+        # Fused int16 -> complex64 pass; releases the GIL so the loader threads run in parallel
+        adcData = np.empty((raw.shape[0], numLanes), dtype=np.complex64)
+        lane_deinterleave(raw, adcData)
+        return adcData
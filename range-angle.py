@@ -1,5 +1,6 @@
 import argparse
 from src.iwr1443.radar import Radar
+from src.iwr1443.dsp import background_subtraction
 import numpy as np
 from PyQt6 import QtWidgets
 from src.range_angle_plot import RangeAngleHeatmap
@@ -7,14 +8,6 @@ import sys
 from scipy.fft import fft, fftfreq
 
 
-def background_subtraction(frame):
-    after_subtraction = np.zeros_like(frame)
-    for i in range(1, frame.shape[0]):
-        after_subtraction[i - 1] = frame[i] - frame[i - 1]
-
-    return after_subtraction
-
-
 def main():
     parser = argparse.ArgumentParser()
     parser.add_argument("--cfg", type=str, required=True)
@@ -8,6 +8,59 @@ Modified from: https://github.com/ConnectedSystemsLab/xwr_raw_ros/blob/main/src/
 import socket
 import struct
 import errno
+import ctypes
+import os
+import select
+import sys
+
+# Largest datagram we read off the data socket
+MAX_PACKET_SIZE = 2048
+# Number of datagrams harvested per recv_data_batch call
+RECV_BATCH_SIZE = 64
+
+# seqn (uint32), byte count (uint48, low 32 bits used) header on every data packet
+_DATA_HEADER = struct.Struct("<IIxx")
+
+
+class _IOVec(ctypes.Structure):
+    _fields_ = [("iov_base", ctypes.c_void_p), ("iov_len", ctypes.c_size_t)]
+
+
+class _MsgHdr(ctypes.Structure):
+    _fields_ = [
+        ("msg_name", ctypes.c_void_p),
+        ("msg_namelen", ctypes.c_uint32),
+        ("msg_iov", ctypes.POINTER(_IOVec)),
+        ("msg_iovlen", ctypes.c_size_t),
+        ("msg_control", ctypes.c_void_p),
+        ("msg_controllen", ctypes.c_size_t),
+        ("msg_flags", ctypes.c_int),
+    ]
+
+
+class _MMsgHdr(ctypes.Structure):
+    _fields_ = [("msg_hdr", _MsgHdr), ("msg_len", ctypes.c_uint)]
+
+
+def _load_recvmmsg():
+    """
+    Returns libc's recvmmsg, or None when it isn't available (non-Linux platforms).
+    """
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        recvmmsg = ctypes.CDLL(None, use_errno=True).recvmmsg
+    except (OSError, AttributeError):
+        return None
+    recvmmsg.argtypes = [
+        ctypes.c_int,
+        ctypes.POINTER(_MMsgHdr),
+        ctypes.c_uint,
+        ctypes.c_int,
+        ctypes.c_void_p,
+    ]
+    recvmmsg.restype = ctypes.c_int
+    return recvmmsg
 
 
 class DCA1000:
@@ -57,9 +110,34 @@ class DCA1000:
             # Set a longer timeout for large frame captures (30 seconds)
             self.data_socket.settimeout(30.0)
             self.data_socket.setblocking(True)
+            self._setup_batch_recv()
 
         self.capturing = False
 
+    def _setup_batch_recv(self):
+        """
+        Preallocates the buffer used by recv_data_batch and, on Linux, the recvmmsg
+        message vector pointing into it.
+        """
+        self.batch_buffer = bytearray(RECV_BATCH_SIZE * MAX_PACKET_SIZE)
+        self._batch_view = memoryview(self.batch_buffer)
+        # Single-packet buffer reused by recv_data/recv_ts_data/flush_data_socket
+        self._pktbuf = bytearray(MAX_PACKET_SIZE)
+        self._pktview = memoryview(self._pktbuf)
+        self._recvmmsg = _load_recvmmsg()
+        if self._recvmmsg is None:
+            return
+
+        self._batch_cbuf = (ctypes.c_char * len(self.batch_buffer)).from_buffer(self.batch_buffer)
+        base = ctypes.addressof(self._batch_cbuf)
+        self._iovecs = (_IOVec * RECV_BATCH_SIZE)()
+        self._msgvec = (_MMsgHdr * RECV_BATCH_SIZE)()
+        for i in range(RECV_BATCH_SIZE):
+            self._iovecs[i].iov_base = base + i * MAX_PACKET_SIZE
+            self._iovecs[i].iov_len = MAX_PACKET_SIZE
+            self._msgvec[i].msg_hdr.msg_iov = ctypes.pointer(self._iovecs[i])
+            self._msgvec[i].msg_hdr.msg_iovlen = 1
+
     def _recv_cmd(self):
         msg, _ = self.cmd_socket.recvfrom(2048)
         return " ".join(msg.hex()[i : i + 2] for i in range(0, len(msg.hex()), 2))
@@ -105,17 +183,62 @@ class DCA1000:
                 print("[DCA1000] failed to get timeout")
             if timeout is not None: 
                 print(f"[DCA1000] recv_data: waiting on data_socket (timeout={timeout}s)")
-            msg, _ = self.data_socket.recvfrom(2048)
+            nbytes = self.data_socket.recv_into(self._pktview)
         except socket.timeout: 
             print("[DCA1000] recv")
-        seqn, bytec = struct.unpack("<IIxx", msg[:10])
+        seqn, bytec = _DATA_HEADER.unpack_from(self._pktbuf)
+
+        # Zero-copy view into the reused packet buffer; only valid until the next recv
+        return seqn, bytec, self._pktview[_DATA_HEADER.size : nbytes]
+
+    def recv_data_batch(self):
+        """
+        Receives up to RECV_BATCH_SIZE data packets, using a single recvmmsg syscall on Linux
+        and a single recv_into elsewhere.
+
+        Returns:
+            list of (seqn, bytec, start, stop) tuples. The payload of each packet is
+            batch_buffer[start:stop], which is reused and only valid until the next call.
+        """
+        if self._recvmmsg is None:
+            nbytes = self.data_socket.recv_into(self._batch_view[:MAX_PACKET_SIZE])
+            seqn, bytec = _DATA_HEADER.unpack_from(self.batch_buffer, 0)
+            return [(seqn, bytec, _DATA_HEADER.size, nbytes)]
+
+        # While streaming the queue is rarely empty, so try to drain it first and only
+        # wait (sockets with a timeout are non-blocking underneath) when nothing is queued
+        n_msgs = self._recvmmsg_nowait()
+        if n_msgs == 0:
+            if not select.select([self.data_socket], [], [], self.data_socket.gettimeout())[0]:
+                raise socket.timeout("timed out")
+            n_msgs = self._recvmmsg_nowait()
+
+        batch = []
+        for i in range(n_msgs):
+            off = i * MAX_PACKET_SIZE
+            seqn, bytec = _DATA_HEADER.unpack_from(self.batch_buffer, off)
+            batch.append((seqn, bytec, off + _DATA_HEADER.size, off + self._msgvec[i].msg_len))
+        return batch
+
+    def _recvmmsg_nowait(self):
+        """
+        Non-blocking recvmmsg into the batch buffer. Returns the number of packets received.
+        """
+        n_msgs = self._recvmmsg(
+            self.data_socket.fileno(), self._msgvec, RECV_BATCH_SIZE, socket.MSG_DONTWAIT, None
+        )
+        if n_msgs < 0:
+            err = ctypes.get_errno()
+            if err in (errno.EAGAIN, errno.EWOULDBLOCK):
+                return 0
+            raise OSError(err, os.strerror(err))
+        return n_msgs
 
-        return seqn, bytec, msg[10:]
     def recv_ts_data(self):
-        msg, _ = self.data_socket.recvfrom(2048)
-        seqn, bytec, ts = struct.unpack("<IIQ", msg[:16])
+        nbytes = self.data_socket.recv_into(self._pktview)
+        seqn, bytec, ts = struct.unpack_from("<IIQ", self._pktbuf)
 
-        return seqn, bytec, ts, msg[16:]
+        return seqn, bytec, ts, self._pktview[16:nbytes]
     def close(self):
         if hasattr(self, "cmd_socket"):
             self.cmd_socket.close()
@@ -128,7 +251,7 @@ class DCA1000:
         try:
             while True:
                 try:
-                    self.data_socket.recvfrom(2048)
+                    self.data_socket.recv_into(self._pktview)
                 except socket.error as e:
                     if e.errno == errno.EWOULDBLOCK or e.errno == errno.EAGAIN:
                         break  # No more data to read
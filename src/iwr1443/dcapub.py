@@ -8,11 +8,28 @@ Modified from: https://github.com/ConnectedSystemsLab/xwr_raw_ros/blob/main/src/
 """
 
 import socket
+import sys
+
+import numpy as np
 
 from .radar_config import RadarConfig
 from .dca1000 import DCA1000
 from .frame_buffer import FrameBuffer
 
+# Linux socket options not exported by the socket module (see asm-generic/socket.h)
+SO_RCVBUFFORCE = getattr(socket, "SO_RCVBUFFORCE", 33)
+SO_BUSY_POLL = getattr(socket, "SO_BUSY_POLL", 46)
+
+# Receive buffer requested for the data socket. On Linux SO_RCVBUF is silently capped at
+# net.core.rmem_max (often ~208 KB), so for production captures either run with CAP_NET_ADMIN
+# (SO_RCVBUFFORCE ignores the cap) or raise the cap with:
+#     sysctl -w net.core.rmem_max=67108864
+RCVBUF_SIZE = 64 * 1024 * 1024
+# Microseconds to busy poll the NIC queue before sleeping on a receive
+BUSY_POLL_US = 50
+# Interactive priority band for radar packets
+SOCKET_PRIORITY = 6
+
 
 class DCAPub:
 
@@ -54,17 +71,18 @@ class DCAPub:
         if hasattr(self.dca1000, "data_socket"):
             # Increase buffer size significantly to hold all frames
             # For 4000 frames: 4000 * 4096 bytes = 16.384 MB
-            # Set to 50x to ensure no packet loss
-            buffer_size = 131071 * 50  # ~6.5 MB buffer
-            try:
-                self.dca1000.data_socket.setsockopt(
-                    socket.SOL_SOCKET, socket.SO_RCVBUF, buffer_size
-                )
-            except OSError as e:
-                print(f"[WARN] Could not set full buffer size: {e}")
-            # Verify the buffer size was set
-            actual_size = self.dca1000.data_socket.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF)
-            print(f"[INFO] UDP receive buffer set to {actual_size} bytes (requested {buffer_size})")
+            self._set_rcvbuf(RCVBUF_SIZE)
+
+            if sys.platform.startswith("linux"):
+                # Reduce wakeup latency for radar packets; both are best effort
+                for name, opt, value in (
+                    ("SO_BUSY_POLL", SO_BUSY_POLL, BUSY_POLL_US),
+                    ("SO_PRIORITY", socket.SO_PRIORITY, SOCKET_PRIORITY),
+                ):
+                    try:
+                        self.dca1000.data_socket.setsockopt(socket.SOL_SOCKET, opt, value)
+                    except OSError as e:
+                        print(f"[WARN] Could not set {name}: {e}")
 
             # If caller supplied a socket timeout, configure it here so recv calls
             # won't block indefinitely. This allows higher-level code to catch
@@ -80,16 +98,88 @@ class DCAPub:
             2 * self.params["frame_size"], self.params["frame_size"]
         )
 
-    def update_frame_buffer(self):
+        # Packets received in the last batch that haven't been added to the frame buffer yet
+        self._pending = []
+        self._pending_idx = 0
+        # int8 view over the DCA1000 batch buffer so packets reach the jitted frame buffer
+        # as (array, offsets) rather than a new Python buffer object per packet
+        self._batch_data = np.frombuffer(self.dca1000.batch_buffer, dtype=np.int8)
+        # Set once the first completed frame has been checked against the caller's buffer
+        self._frame_checked = False
+
+    def _set_rcvbuf(self, buffer_size):
+        """
+        Sets the data socket receive buffer, preferring SO_RCVBUFFORCE on Linux so the
+        net.core.rmem_max cap doesn't apply (requires CAP_NET_ADMIN).
+
+        Args:
+            buffer_size (int): Requested receive buffer size in bytes
+        """
+        data_socket = self.dca1000.data_socket
         try:
-            seqn, bytec, msg = self.dca1000.recv_data()
-        except socket.timeout:
-            # Propagate socket.timeout so callers (e.g., radar.run_polling)
-            # can handle timeouts and implement watchdogs or retries.
-            raise
+            if not sys.platform.startswith("linux"):
+                raise OSError("SO_RCVBUFFORCE is Linux only")
+            data_socket.setsockopt(socket.SOL_SOCKET, SO_RCVBUFFORCE, buffer_size)
+        except OSError:
+            try:
+                data_socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, buffer_size)
+            except OSError as e:
+                print(f"[WARN] Could not set full buffer size: {e}")
+
+        # Verify the buffer size was set (Linux reports double the usable size)
+        actual_size = data_socket.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF)
+        print(f"[INFO] UDP receive buffer set to {actual_size} bytes (requested {buffer_size})")
+        if actual_size < buffer_size:
+            print("[WARN] Receive buffer was capped; raise it with `sysctl -w net.core.rmem_max=67108864`")
+
+    def update_frame_buffer(self):
+        # socket.timeout is propagated so callers (e.g., radar.run_polling)
+        # can handle timeouts and implement watchdogs or retries.
+        while self._pending_idx >= len(self._pending):
+            self._pending = self.dca1000.recv_data_batch()
+            self._pending_idx = 0
 
-        frame_data, new_frame = self.frame_buffer.add_msg(seqn, msg)
+        seqn, bytec, start, stop = self._pending[self._pending_idx]
+        self._pending_idx += 1
+
+        frame_data, new_frame = self.frame_buffer.add_packet(seqn, self._batch_data, start, stop)
         return frame_data, new_frame
 
+    def update_frame_buffer_into(self, out):
+        """
+        Like update_frame_buffer, but copies a completed frame into out instead of returning a
+        view into the frame buffer's ring, so callers can keep it after later packets arrive.
+
+        Args:
+            out (np.ndarray): int16 array of frame_size // 2 samples to fill
+
+        Returns:
+            True if out now holds a new frame
+
+        Raises:
+            TypeError: if the first completed frame doesn't match out's dtype and shape
+        """
+        frame_data, new_frame = self.update_frame_buffer()
+        if new_frame:
+            # Check the frames the buffer really produces once, rather than letting the
+            # assignment below silently cast every frame
+            if not self._frame_checked:
+                if frame_data.dtype != out.dtype or frame_data.shape != out.shape:
+                    raise TypeError(
+                        f"Radar frames are {frame_data.dtype} {frame_data.shape}, "
+                        f"expected {out.dtype} {out.shape}"
+                    )
+                self._frame_checked = True
+            out[:] = frame_data
+        return new_frame
+
+    def flush_data_socket(self):
+        """
+        Drops any batched packets and clears the UDP data socket buffer.
+        """
+        self._pending = []
+        self._pending_idx = 0
+        self.dca1000.flush_data_socket()
+
     def close(self):
         self.dca1000.close()
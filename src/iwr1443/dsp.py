@@ -1,12 +1,42 @@
 import numpy as np
+from numba import njit
+
+
+@njit(nogil=True, fastmath=True, cache=True)
+def lane_deinterleave(raw, out):
+    """
+    Convert interleaved int16 lane data to complex samples in a single pass.
+
+    Args:
+        raw (np.ndarray): int16 array of shape (n, 8); columns 0-3 are real, 4-7 imaginary
+        out (np.ndarray): complex64 array of shape (n, 4) that is written in place
+    """
+    for i in range(raw.shape[0]):
+        for j in range(4):
+            out[i, j] = complex(raw[i, j], raw[i, j + 4])
+
+
+def background_subtraction(frame):
+    """
+    Subtract each chirp from the next one to remove static reflections.
+
+    Keeps the input shape; the last row stays zero as there is no next chirp.
+    """
+    after_subtraction = np.zeros_like(frame)
+    np.subtract(frame[1:], frame[:-1], out=after_subtraction[:-1])
+
+    return after_subtraction
+
 
 def reshape_frame(data, n_chirps_per_frame, samples_per_chirp, n_receivers, n_transmitters):
     """
     Reshape the raw data into a 3D array of shape (n_chirps_per_frame, samples_per_chirp, n_receivers).
     """
-    data = data.reshape(-1, 8)  # Assuming we have 4 antennas
+    raw = data.reshape(-1, 8)  # Assuming we have 4 antennas
 
-    data = data[:, :4] + 1j * data[:, 4:]
+    # int16 ADC samples fit losslessly in float32, so complex64 is enough
+    data = np.empty((raw.shape[0], 4), dtype=np.complex64)
+    lane_deinterleave(raw, data)
 
     data = data.reshape(n_chirps_per_frame, samples_per_chirp, n_receivers)
 
@@ -41,9 +41,16 @@ class FrameBuffer:
             self.curr_idx = (self.curr_idx + total_size) % self.buffer.size
         else:
             self.buffer[self.curr_idx : self.curr_idx + total_size] = 0
+            self.curr_idx = (self.curr_idx + total_size) % self.buffer.size
 
     def add_msg(self, seqn, msg):
         msg = np.frombuffer(msg, np.int8)
+        return self.add_packet(seqn, msg, 0, msg.size)
+
+    def add_packet(self, seqn, data, start, stop):
+        # Takes the packet as offsets into an int8 array so a whole receive batch can be
+        # passed in without building a buffer object per packet
+        msg = data[start:stop]
 
         if seqn > self.last_seqn + 1:
             # rospy.loginfo(f'Packet drop when recving seqn {seqn} (last seqn {self.last_seqn}')
@@ -0,0 +1,142 @@
+#!/usr/bin/env/python3
+
+"""Background writer for captured frames.
+
+Lets the capture loop hand off completed frames and keep receiving while they are written to disk,
+so the save at the end of a capture only has to flush what is left.
+"""
+
+import os
+import queue
+import threading
+
+# Largest slice handed to a single write() call
+WRITE_CHUNK_BYTES = 64 * 1024 * 1024
+# Most queued frames gathered into a single writev() call
+WRITEV_MAX_BUFFERS = 64
+
+
+def write_array(f, arr):
+    """
+    Writes the raw bytes of arr to an unbuffered binary file without an intermediate copy.
+
+    Args:
+        f: File opened with open(..., "wb", buffering=0)
+        arr (np.ndarray): C-contiguous array to write; its dtype is written as is
+    """
+    mv = memoryview(arr).cast("B")
+    offset = 0
+    # Raw writes may be partial, so keep going until everything is written
+    while offset < len(mv):
+        offset += f.write(mv[offset : offset + WRITE_CHUNK_BYTES])
+
+
+def write_arrays(f, arrs):
+    """
+    Writes several arrays back to back, gathered into one writev() call where the platform
+    has it (not on Windows) instead of one write() per array.
+
+    Args:
+        f: File opened with open(..., "wb", buffering=0)
+        arrs (list of np.ndarray): C-contiguous arrays to write, in order
+    """
+    if len(arrs) == 1 or not hasattr(os, "writev"):
+        for arr in arrs:
+            write_array(f, arr)
+        return
+
+    mvs = [memoryview(arr).cast("B") for arr in arrs]
+    fd = f.fileno()
+    while mvs:
+        n = os.writev(fd, mvs)
+        # Drop what was written; a partial write can end inside a buffer
+        while mvs and n >= len(mvs[0]):
+            n -= len(mvs.pop(0))
+        if n:
+            mvs[0] = mvs[0][n:]
+
+
+class FrameWriter:
+
+    def __init__(self, path: str, on_written=None, size=None):
+        """
+        Opens path for writing and starts the writer thread.
+
+        Args:
+            path (str): Path of the .bin file to create
+            on_written (callable): Optional callback given each array once it has been written,
+                e.g. to hand a reusable buffer back to the capture loop
+            size (int): Optional expected file size in bytes, preallocated up front where the
+                platform supports it so the file is laid out contiguously
+        """
+        self.path = path
+        self._on_written = on_written
+        self._f = open(path, "wb", buffering=0)
+        self._nbytes = 0
+        self._preallocated = False
+        if size and hasattr(os, "posix_fallocate"):  # not available on Windows
+            try:
+                os.posix_fallocate(self._f.fileno(), 0, size)
+                self._preallocated = True
+            except OSError:
+                # e.g. filesystems without fallocate support; just write without it
+                pass
+        self._q = queue.Queue()
+        self._error = None
+        self._thread = threading.Thread(target=self._run, name="frame_writer", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while True:
+            arr = self._q.get()
+            if arr is None:
+                break
+            # Write whatever else is already queued along with it
+            arrs = [arr]
+            stop = False
+            while len(arrs) < WRITEV_MAX_BUFFERS:
+                try:
+                    arr = self._q.get_nowait()
+                except queue.Empty:
+                    break
+                if arr is None:
+                    stop = True
+                    break
+                arrs.append(arr)
+            if self._error is None:
+                try:
+                    write_arrays(self._f, arrs)
+                    self._nbytes += sum(arr.nbytes for arr in arrs)
+                except OSError as e:
+                    self._error = e
+            # Release the arrays even after an error so the producer never waits on them
+            if self._on_written is not None:
+                for arr in arrs:
+                    self._on_written(arr)
+            if stop:
+                break
+
+    def write(self, arr):
+        """
+        Queues arr to be appended to the file. arr must not be modified until close() returns.
+        """
+        self._q.put(arr)
+
+    def close(self):
+        """
+        Waits for all queued writes, trims the file to what was written, closes it, and
+        re-raises any write error.
+        Calling it again after the file is closed does nothing.
+        """
+        if self._f.closed:
+            return
+        self._q.put(None)
+        self._thread.join()
+        try:
+            # Drop any preallocated space left over when the capture ended early
+            if self._preallocated:
+                self._f.truncate(self._nbytes)
+        finally:
+            self._f.close()
+        if self._error is not None:
+            raise self._error
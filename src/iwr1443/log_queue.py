@@ -0,0 +1,40 @@
+#!/usr/bin/env/python3
+
+"""Queued printing for the capture hot path.
+
+print() takes the GIL and flushes stdout (slow through the Windows console host), which can
+back-pressure the polling loop. Messages are queued instead and printed by a daemon thread.
+"""
+
+import queue
+import threading
+
+_log_q = queue.Queue(maxsize=10000)
+
+
+def _drain():
+    while True:
+        msg = _log_q.get()
+        print(msg)
+        _log_q.task_done()
+
+
+threading.Thread(target=_drain, name="log_queue", daemon=True).start()
+
+
+def log(msg):
+    """
+    Queues msg to be printed by the background thread. Drops it if the queue is full
+    rather than blocking the caller.
+    """
+    try:
+        _log_q.put_nowait(msg)
+    except queue.Full:
+        pass
+
+
+def flush():
+    """
+    Blocks until every queued message has been printed.
+    """
+    _log_q.join()
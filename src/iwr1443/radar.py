@@ -4,9 +4,20 @@ import numpy as np
 import socket
 from .dcapub import DCAPub
 from .dsp import reshape_frame
-import argparse
+from .frame_writer import FrameWriter
+from . import log_queue
 import os
 import json
+import queue
+import time
+
+try:
+    import orjson  # optional, faster metadata serialization
+except ImportError:
+    orjson = None
+
+# Receive buffers cycled between the capture loop and the background writer
+RX_BUFFERS = 8
 
 class Radar:
 
@@ -42,56 +53,106 @@ class Radar:
         self.angles = angles
         self.exp_num = exp_num
         self.is_los = is_los
-        self.count = 0
         self.capture_start_time = None
-        self.datetime_start_time = None
         self.start = False 
 
+        x, y, z = angles
+        los_folder = "los" if is_los else "nlos"
+
+        # MITO folder structure; only depends on the arguments above, so build and create it once
+        # Path: data/{obj_id}_{obj_name}/robot_collected/{x}_{y}_{z}/exp{N}/{los/nlos}/unprocessed/radars/radar_data/
+        sep = os.sep
+        # Joined onto stamped_data_path so an empty base stays a relative path
+        self._base_path = os.path.join(
+            stamped_data_path,
+            f"{obj_id}_{obj_name}{sep}robot_collected{sep}{x}_{y}_{z}{sep}exp{exp_num}{sep}"
+            f"{los_folder}{sep}unprocessed{sep}radars{sep}radar_data",
+        )
+        os.makedirs(self._base_path, exist_ok=True)
+
+        # Metadata fields that are the same for every capture with this config
+        self._metadata_template = {
+            "num_samples": self.params['n_samples'],
+            "num_chirps": self.params['n_chirps'],
+            "num_rx": self.params['n_rx'],
+            "num_tx": self.params['n_tx'],
+            "periodicity": self.config.get('frameCfg', {}).get('framePeriodicity', 0),
+            "sweep_time": self.params.get('sweep_time', 0),
+        }
         
+        # Frames are received into these preallocated buffers, which go back on the free
+        # queue once the writer has saved them, so there's no per-frame allocation
+        self._rx_bufs = [np.empty(self.params["frame_size"] // 2, dtype="<i2") for _ in range(RX_BUFFERS)]
+        # FrameWriter writes these bytes as is, so they use the .bin format's little-endian int16;
+        # DCAPub checks the first frame the radar produces against them
+        self._free_rx_bufs = queue.Queue()
+        for buf in self._rx_bufs:
+            self._free_rx_bufs.put(buf)
+
         print("[INFO] Radar connected. Params:")
         print(self.radar.config)
 
         self.reshape = reshape
     
-    # In radar.py - when you start capturing
     def run_polling(self, cb=None, max_no_frame_seconds: float = 10.0):
         """Capture a fixed number of frames, aborting if no new frames arrive for
         `max_no_frame_seconds` to avoid hanging when the stream stalls.
         """
         print("[INFO] Begin capturing data!")
-        self.radar.dca1000.flush_data_socket()
+        self.radar.flush_data_socket()
 
-        import time
+        # Watchdog runs on the monotonic clock; wall-clock time is only used for the capture timestamp
+        monotonic = time.monotonic
+        last_frame_time = monotonic()
 
-        last_frame_time = time.time()
+        # Bind what the loop touches on every iteration to locals
+        n_frames = self.params['n_frames']
+        update_into = self.radar.update_frame_buffer_into
+        get_free_buf = self._free_rx_bufs.get
+        log = log_queue.log
 
-        frames = []
+        n_captured = 0
+        writer = None
+        rx_buf = get_free_buf()
         try:
             
-            while len(frames) < self.params['n_frames']:
+            while n_captured < n_frames:
                 try:
-                    frame_data, new_frame = self.radar.update_frame_buffer()
+                    new_frame = update_into(rx_buf)
                     
                     if new_frame:
                         if not self.start:
                             self.start = True 
-                        last_frame_time = time.time()
-                        frames.append(frame_data)
+                            # One start timestamp (raw epoch) for the whole capture
+                            self.capture_start_time = time.time()
+                            # Write to disk in the background while the capture is running
+                            timestamp_compact = self.timestamp_compact(self.capture_start_time)
+                            writer = FrameWriter(
+                                os.path.join(self._base_path, f"adc_data{timestamp_compact}.bin"),
+                                on_written=self._free_rx_bufs.put,
+                                size=n_frames * rx_buf.nbytes,
+                            )
+                        last_frame_time = monotonic()
+                        # Stream each frame to disk rather than holding the capture in memory,
+                        # and keep receiving into the next free buffer meanwhile
+                        writer.write(rx_buf)
+                        rx_buf = get_free_buf()
+                        n_captured += 1
                         
-                        print(f"[INFO] Captured frame {len(frames)}/{self.params['n_frames']}")
+                        log(f"[INFO] Captured frame {n_captured}/{n_frames}")
                         continue
                     
 
                     # If no new frame was returned, check the watchdog
-                    if time.time() - last_frame_time >= max_no_frame_seconds and self.start:
+                    if monotonic() - last_frame_time >= max_no_frame_seconds and self.start:
                         print(f"[WARN] No new frames received for {max_no_frame_seconds} seconds")
-                        print(f"[INFO] Captured {len(frames)}/{self.params['n_frames']} frames before timeout")
+                        print(f"[INFO] Captured {n_captured}/{n_frames} frames before timeout")
                         break
 
                 except socket.timeout:
-                    print(f"[ERROR] Socket timeout! Captured {len(frames)}/{self.params['n_frames']} frames")
+                    print(f"[ERROR] Socket timeout! Captured {n_captured}/{n_frames} frames")
                     # keep waiting until watchdog expires (or break immediately)
-                    if time.time() - last_frame_time >= max_no_frame_seconds:
+                    if monotonic() - last_frame_time >= max_no_frame_seconds:
                         break
                     else:
                         continue
@@ -100,17 +161,26 @@ class Radar:
                 except Exception as e:
                     print(f"[ERROR] Error receiving frame: {e}")
                     break
+
+            # Let queued frame messages print before the summary below
+            log_queue.flush()
             
             # Save all frames with the ONE start timestamp
-            if len(frames) > 0:
-                self.save_frames(frames, self.datetime_start_time, self.capture_start_time)
-                print(f"[INFO] Successfully saved {len(frames)} frames!")
+            if n_captured > 0:
+                self.save_frames(writer, n_captured, self.capture_start_time)
+                print(f"[INFO] Successfully saved {n_captured} frames!")
             else:
                 print("[ERROR] No frames captured!")
                 
         except Exception as e:
             print(f"[ERROR] Exception during frame capture: {e}")
         finally:
+            if writer is not None:
+                try:
+                    writer.close()
+                except OSError as e:
+                    print(f"[ERROR] Failed writing frames: {e}")
+            self._free_rx_bufs.put(rx_buf)
             # Ensure the DCA connection is closed on exit
             try:
                 self.close()
@@ -118,65 +188,51 @@ class Radar:
                 print("[WARN] Exception during radar close")
                 pass
     
-    def save_frames(self, frames, datetime_start_time, capture_start_time):
+    @staticmethod
+    def timestamp_compact(capture_start_time):
+        """
+        Returns the integer Unix timestamp string used in capture filenames.
+        """
+        return f"{int(capture_start_time):d}"
+
+    def save_frames(self, writer, n_frames, capture_start_time):
         """
-        Saves all frames in MITO-compatible folder structure.
+        Finishes writing the captured frames and saves their metadata in MITO-compatible folder structure.
         
         Args:
-            frames (list): List of frame data arrays
+            writer (FrameWriter): Writer the captured frames were queued on
+            n_frames (int): Number of frames captured
             capture_start_time (float): Timestamp from time.time() when capture started
         """
-        # Create MITO folder structure
-        x, y, z = self.angles
-        los_folder = "los" if self.is_los else "nlos"
-        
-        # Path: data/{obj_id}_{obj_name}/robot_collected/{x}_{y}_{z}/exp{N}/{los/nlos}/unprocessed/radars/radar_data/
-        base_path = os.path.join(
-            self.stamped_data_path,
-            f"{self.obj_id}_{self.obj_name}",
-            "robot_collected",
-            f"{x}_{y}_{z}",
-            f"exp{self.exp_num}",
-            los_folder,
-            "unprocessed",
-            "radars",
-            "radar_data"
-        )
-        os.makedirs(base_path, exist_ok=True)
-        
-        # Concatenate all frames into single array
-        all_frames = np.concatenate(frames, axis=0)
+        # MITO folder structure, created in __init__
+        base_path = self._base_path
         
-        # Convert to int16 and save as .bin file
-        raw_data = np.asarray(all_frames, dtype="<i2")
+        # Only the frames not yet written in the background are left to flush
+        writer.close()
         
-        # Create timestamp string using Unix timestamp
-        # Use integer part of timestamp for filename
-        timestamp_compact = str(int(capture_start_time))
+        # Same integer Unix timestamp as the .bin filename
+        timestamp_compact = self.timestamp_compact(capture_start_time)
+        # Human readable form, formatted once here rather than during capture
+        datetime_strftime = datetime.fromtimestamp(capture_start_time).isoformat(sep=" ", timespec="microseconds")
         
-        bin_filename = os.path.join(base_path, f"adc_data{timestamp_compact}.bin")
-        with open(bin_filename, "wb") as f:
-            raw_data.tofile(f)
-        
-        print(f"[INFO] Saved {len(frames)} frames to {bin_filename}")
+        print(f"[INFO] Saved {n_frames} frames to {writer.path}")
         
         # Save metadata.json in the parent directory (unprocessed/radars/)
         metadata_path = os.path.join(base_path, f"metadata_{timestamp_compact}.json")
         metadata = {
             "capture_start_time": capture_start_time,
             "timestamp_compact": timestamp_compact,
-            "datetime_strftime": datetime_start_time.strftime("%Y-%m-%d %H:%M:%S.%f"),
-            "num_frames": len(frames),
-            "num_samples": self.params['n_samples'],
-            "num_chirps": self.params['n_chirps'],
-            "num_rx": self.params['n_rx'],
-            "num_tx": self.params['n_tx'],
-            "periodicity": self.config.get('frameCfg', {}).get('framePeriodicity', 0),
-            "sweep_time": self.params.get('sweep_time', 0),
+            "datetime_strftime": datetime_strftime,
+            "num_frames": n_frames,
         }
+        metadata.update(self._metadata_template)
         
-        with open(metadata_path, "w") as f:
-            json.dump(metadata, f, indent=4)
+        if orjson is not None:
+            with open(metadata_path, "wb") as f:
+                f.write(orjson.dumps(metadata, option=orjson.OPT_INDENT_2))
+        else:
+            with open(metadata_path, "w") as f:
+                json.dump(metadata, f, indent=2)
         
         print(f"[INFO] Saved metadata to {metadata_path}")
 
@@ -187,7 +243,7 @@ class Radar:
         """
 
         # Flush the data socket to clear any old data
-        self.radar.dca1000.flush_data_socket()
+        self.radar.flush_data_socket()
 
         second = False
 
@@ -217,7 +273,7 @@ class Radar:
         """
         Flushes the data socket to clear any old data.
         """
-        self.radar.dca1000.flush_data_socket()
+        self.radar.flush_data_socket()
 
     def close(self):
         """
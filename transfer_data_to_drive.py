@@ -15,12 +15,73 @@ Usage:
 """
 
 import os
+import sys
+import errno
 import shutil
 import json
 import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
+try:
+    import orjson  # optional, faster metadata serialization
+except ImportError:
+    orjson = None
+
+# Largest range handed to a single copy_file_range/sendfile call
+COPY_CHUNK_BYTES = 1 << 30
+# Number of files transferred concurrently
+TRANSFER_WORKERS = 4
+
+# Keeps progress messages from concurrent transfers from interleaving
+_print_lock = threading.Lock()
+
+def copy_file(src, dst):
+    """
+    Copy src to dst along with its metadata, like shutil.copy2.
+    
+    On Linux the data is copied in the kernel with copy_file_range (falling back to sendfile),
+    so it never passes through a userspace buffer. Other platforms use shutil.copy2, which
+    already uses the native fast copy there.
+    
+    Args:
+        src: Path of the file to copy
+        dst: Destination file path
+    """
+    if not sys.platform.startswith('linux'):
+        shutil.copy2(src, dst)
+        return
+    
+    src_fd = os.open(src, os.O_RDONLY)
+    try:
+        dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            remaining = os.fstat(src_fd).st_size
+            use_copy_file_range = hasattr(os, 'copy_file_range')
+            while remaining > 0:
+                count = min(remaining, COPY_CHUNK_BYTES)
+                if use_copy_file_range:
+                    try:
+                        copied = os.copy_file_range(src_fd, dst_fd, count)
+                    except OSError as e:
+                        # e.g. cross-filesystem copies on older kernels
+                        if e.errno not in (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP):
+                            raise
+                        use_copy_file_range = False
+                        continue
+                else:
+                    copied = os.sendfile(dst_fd, src_fd, None, count)
+                if copied == 0:
+                    break
+                remaining -= copied
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+    shutil.copystat(src, dst)
+
 def find_bin_files(source_dir, timestamp=None):
     """
     Find .bin files in the source directory.
@@ -30,23 +91,26 @@ def find_bin_files(source_dir, timestamp=None):
         timestamp: Optional specific timestamp to look for
     
     Returns:
-        List of (timestamp, filepath) tuples
+        List of (timestamp, filepath, stat_result) tuples
     """
     bin_files = []
-    for filename in os.listdir(source_dir):
-        if filename.startswith('adc_data_') and filename.endswith('_Raw_0.bin'):
-            # Extract timestamp from filename: adc_data_{timestamp}_Raw_0.bin
-            ts_str = filename.replace('adc_data_', '').replace('_Raw_0.bin', '')
-            try:
-                ts = int(ts_str)
-                if timestamp is None or ts == timestamp:
-                    bin_files.append((ts, os.path.join(source_dir, filename)))
-            except ValueError:
-                print(f"Warning: Could not parse timestamp from {filename}")
+    with os.scandir(source_dir) as entries:
+        for entry in entries:
+            filename = entry.name
+            if filename.startswith('adc_data_') and filename.endswith('_Raw_0.bin'):
+                # Extract timestamp from filename: adc_data_{timestamp}_Raw_0.bin
+                ts_str = filename.replace('adc_data_', '').replace('_Raw_0.bin', '')
+                try:
+                    ts = int(ts_str)
+                    if timestamp is None or ts == timestamp:
+                        # DirEntry caches its stat, so later size/time lookups are free
+                        bin_files.append((ts, entry.path, entry.stat()))
+                except ValueError:
+                    print(f"Warning: Could not parse timestamp from {filename}")
     
     return sorted(bin_files, key=lambda x: x[0])
 
-def create_metadata_file(bin_filepath, output_dir, timestamp, params):
+def create_metadata_file(bin_filepath, output_dir, timestamp, params, st=None):
     """
     Create a metadata JSON file matching the .bin file.
     
@@ -55,10 +119,13 @@ def create_metadata_file(bin_filepath, output_dir, timestamp, params):
         output_dir: Directory to save metadata
         timestamp: Timestamp for the file
         params: Radar parameters dictionary
+        st: Optional os.stat_result of the .bin file (stat'ed here if not given)
     """
+    if st is None:
+        st = os.stat(bin_filepath)
     # Get file creation and modification times
-    ctime = os.path.getctime(bin_filepath)
-    mtime = os.path.getmtime(bin_filepath)
+    ctime = st.st_ctime
+    mtime = st.st_mtime
     
     # Create metadata
     metadata = {
@@ -77,17 +144,22 @@ def create_metadata_file(bin_filepath, output_dir, timestamp, params):
         "slope_hz_per_sample": params.get('slope', 6001200),
         "sample_rate_ksps": params.get('sample_rate', 10000),
         "source_file": os.path.basename(bin_filepath),
-        "file_size_bytes": os.path.getsize(bin_filepath)
+        "file_size_bytes": st.st_size
     }
     
     # Save metadata
     metadata_filename = f"metadata_{timestamp}.json"
     metadata_path = os.path.join(output_dir, metadata_filename)
     
-    with open(metadata_path, 'w') as f:
-        json.dump(metadata, f, indent=4)
+    if orjson is not None:
+        with open(metadata_path, 'wb') as f:
+            f.write(orjson.dumps(metadata, option=orjson.OPT_INDENT_2, default=str))
+    else:
+        with open(metadata_path, 'w') as f:
+            json.dump(metadata, f, indent=2, default=str)
     
-    print(f"  Created metadata: {metadata_filename}")
+    with _print_lock:
+        print(f"  Created metadata: {metadata_filename}")
     return metadata_path
 
 def get_radar_params(config_file=None):
@@ -158,7 +230,7 @@ def transfer_data(source_dir, dest_base, obj_id, obj_name, x_angle=0, y_angle=0,
     
     # Create destination path following MITO structure
     los_folder = "los" if is_los else "nlos"
-    dest_dir = os.path.join(
+    dest_dir = Path(
         dest_base,
         f"{obj_id}_{obj_name}",
         "robot_collected",
@@ -173,25 +245,33 @@ def transfer_data(source_dir, dest_base, obj_id, obj_name, x_angle=0, y_angle=0,
     print(f"\nDestination: {dest_dir}")
     
     if not dry_run:
-        os.makedirs(dest_dir, exist_ok=True)
+        dest_dir.mkdir(parents=True, exist_ok=True)
     
-    # Transfer each file
-    for ts, bin_path in bin_files:
-        print(f"\nTransferring timestamp {ts}:")
+    def transfer_one(bin_file):
+        ts, bin_path, st = bin_file
         
         # New filename without _Raw_0 suffix to match MITO format
         new_bin_name = f"adc_data{ts}.bin"
-        dest_bin_path = os.path.join(dest_dir, new_bin_name)
+        dest_bin_path = dest_dir / new_bin_name
         
         if dry_run:
-            print(f"  [DRY RUN] Would copy: {os.path.basename(bin_path)} -> {new_bin_name}")
-        else:
-            # Copy .bin file
-            shutil.copy2(bin_path, dest_bin_path)
-            print(f"  Copied: {new_bin_name} ({os.path.getsize(bin_path) / 1024 / 1024:.2f} MB)")
-            
-            # Create metadata file
-            create_metadata_file(bin_path, dest_dir, ts, params)
+            with _print_lock:
+                print(f"\nTransferring timestamp {ts}:")
+                print(f"  [DRY RUN] Would copy: {os.path.basename(bin_path)} -> {new_bin_name}")
+            return
+        
+        # Copy .bin file
+        copy_file(bin_path, dest_bin_path)
+        with _print_lock:
+            print(f"\nTransferring timestamp {ts}:")
+            print(f"  Copied: {new_bin_name} ({st.st_size / 1024 / 1024:.2f} MB)")
+        
+        # Create metadata file
+        create_metadata_file(bin_path, dest_dir, ts, params, st)
+    
+    # Files are independent and copies to cloud-synced folders are latency bound, so overlap them
+    with ThreadPoolExecutor(max_workers=TRANSFER_WORKERS) as pool:
+        list(pool.map(transfer_one, bin_files))
     
     print(f"\n✓ Transfer complete! {len(bin_files)} file(s) transferred.")
     print(f"  Data location: {dest_dir}")
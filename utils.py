@@ -1,32 +1,39 @@
 
 import json
 import os
+from functools import lru_cache
 
+@lru_cache(maxsize=None)
 def load_param_json():
     """
-    Load the param.json file
+    Load the param.json file. The parsed file is cached since params don't change during a run,
+    so treat the returned dictionary as read-only.
 
     Returns: Nested dictionaries of parameters from json file
     """
-    f = open(f'{get_root_path()}/src/utilities/params.json')
-    params = json.load(f)
+    with open(os.path.join(get_root_path(), 'src', 'utilities', 'params.json')) as f:
+        params = json.load(f)
     return params
 
 
+@lru_cache(maxsize=None)
 def get_root_path():
     """
     Returns the path to the root of the repo
     """
     cwd = os.path.abspath(os.path.dirname(__file__))
     return f'{cwd}'
+
+@lru_cache(maxsize=None)
 def get_data_path():
     """
     Returns the path to the data folder
     """
     return os.path.join(get_root_path(), 'stamped_raw')
 
+@lru_cache(maxsize=None)
 def get_sim_path():
     """
     Returns the path to the data folder
     """
-    return os.path.join(get_root_path(), 'sim_raw')
\ No newline at end of file
+    return os.path.join(get_root_path(), 'sim_raw')